@@ -1,14 +1,67 @@
 # analysis.py
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import duckdb
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; must be selected before pyplot is imported
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+from numba import njit, prange
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
+import sys
 import markdown
 import pdfkit
 
+# Explicit schema for the transactions CSV so PyArrow skips type inference
+CSV_COLUMN_TYPES = {
+    'TransactionID': pa.int64(),
+    'Date': pa.timestamp('ns'),
+    'StockSymbol': pa.string(),
+    'CompanyName': pa.string(),
+    'Sector': pa.string(),
+    'TransactionType': pa.string(),
+    'Quantity': pa.int32(),
+    'PricePerShare': pa.float64(),
+    'TotalAmount': pa.float64(),
+    'Broker': pa.string(),
+    'PortfolioName': pa.string(),
+    'CustomerAge': pa.int16(),
+    'CustomerGender': pa.string(),
+    'InvestmentHorizon': pa.string()
+}
+
+# CSV block size for the memory-bounded streaming aggregation
+STREAMING_BLOCK_SIZE = 64 << 20
+
+# Figure style applied once at import; constrained layout replaces per-chart tight_layout calls
+plt.rcParams.update({
+    'figure.autolayout': False,
+    'figure.constrained_layout.use': True,
+    'savefig.dpi': 100,
+    'font.size': 10
+})
+
+# Chart output settings: fast, low PNG compression
+SAVEFIG_OPTIONS = {'pil_kwargs': {'compress_level': 1}}
+
+# Low-cardinality string columns stored as pandas categoricals after load
+CATEGORICAL_COLUMNS = [
+    'StockSymbol', 'CompanyName', 'Sector', 'TransactionType', 'Broker',
+    'PortfolioName', 'CustomerGender', 'InvestmentHorizon'
+]
+
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+# Columns the charts group by; each becomes one grouping set in the fused aggregation query
+AGGREGATE_KEYS = ['Sector', 'StockSymbol', 'Broker', 'TransactionType', 'MonthNum', 'Date']
+
 def setup_directories():
     """
     Create necessary directories for charts and reports if they don't exist.
@@ -18,16 +71,21 @@ def setup_directories():
 
 def load_data(filepath):
     """
-    Load the financial data from a CSV file.
+    Load the financial data from a CSV file using PyArrow's multithreaded CSV reader.
     
     Parameters:
         filepath (str): Path to the CSV file.
         
     Returns:
-        pd.DataFrame: Loaded data.
+        pd.DataFrame: Loaded data, sorted by Date.
     """
     try:
-        data = pd.read_csv(filepath, parse_dates=['Date'])
+        convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+        table = pacsv.read_csv(filepath, convert_options=convert_options)
+        data = table.to_pandas(split_blocks=True, self_destruct=True)
+        for col in CATEGORICAL_COLUMNS:
+            data[col] = data[col].astype('category')
+        data = data.sort_values('Date', kind='mergesort').reset_index(drop=True)
         print("Data loaded successfully.")
         return data
     except FileNotFoundError:
@@ -59,7 +117,6 @@ def visualize_missing_values(data):
     fig, ax = plt.subplots(figsize=(12,8))
     sns.heatmap(data.isnull(), cbar=False, cmap='viridis', ax=ax)
     plt.title('Missing Values Heatmap')
-    plt.tight_layout()
     return fig
 
 def handle_missing_values(data):
@@ -72,15 +129,17 @@ def handle_missing_values(data):
     Returns:
         pd.DataFrame: Dataset with missing values handled.
     """
+    missing_counts = data.isnull().sum()
     print("\n=== Missing Values Before Cleaning ===")
-    print(data.isnull().sum())
+    print(missing_counts)
     
-    # Fill missing values for categorical columns with mode
+    # Fill missing values for categorical columns with mode in a single vectorized pass
     categorical_cols = ['Broker', 'CustomerGender', 'InvestmentHorizon']
-    for col in categorical_cols:
-        if data[col].isnull().sum() > 0:
-            mode = data[col].mode()[0]
-            data[col].fillna(mode, inplace=True)
+    cols_to_fill = [col for col in categorical_cols if missing_counts[col] > 0]
+    if cols_to_fill:
+        modes = data[cols_to_fill].mode(dropna=True).iloc[0].to_dict()
+        data.fillna(modes, inplace=True)
+        for col, mode in modes.items():
             print(f"Filled missing values in '{col}' with mode: {mode}")
     
     print("\n=== Missing Values After Cleaning ===")
@@ -89,7 +148,7 @@ def handle_missing_values(data):
 
 def remove_duplicates(data):
     """
-    Remove duplicate records from the dataset.
+    Remove duplicate records from the dataset, identified by their TransactionID.
     
     Parameters:
         data (pd.DataFrame): The dataset.
@@ -99,12 +158,35 @@ def remove_duplicates(data):
         int: Number of duplicates removed.
     """
     initial_count = data.shape[0]
-    data.drop_duplicates(inplace=True)
+    # Hash the single integer key column instead of every column of each row
+    data = data.drop_duplicates(subset=['TransactionID'], keep='first', ignore_index=True)
     final_count = data.shape[0]
     duplicates_removed = initial_count - final_count
     print(f"\n=== Duplicate Records Removed: {duplicates_removed} ===")
     return data, duplicates_removed
 
+def compute_quartiles(values):
+    """
+    Compute the first and third quartiles using an O(N) partition instead of a full sort.
+    
+    Parameters:
+        values (np.ndarray): Numeric values without missing entries.
+        
+    Returns:
+        tuple: First and third quartiles, linearly interpolated like pandas' quantile (NaN when empty).
+    """
+    if values.size == 0:
+        return np.nan, np.nan
+    last = values.size - 1
+    positions = [0.25 * last, 0.75 * last]
+    lower = [int(position) for position in positions]
+    upper = [min(index + 1, last) for index in lower]
+    partitioned = np.partition(values, sorted(set(lower + upper)))
+    return tuple(
+        partitioned[lo] + (partitioned[hi] - partitioned[lo]) * (position - lo)
+        for position, lo, hi in zip(positions, lower, upper)
+    )
+
 def detect_and_handle_outliers(data):
     """
     Detect and handle outliers in the 'TotalAmount' column using the IQR method.
@@ -116,33 +198,46 @@ def detect_and_handle_outliers(data):
         pd.DataFrame: Dataset with outliers handled.
         int: Number of outliers detected.
     """
-    Q1 = data['TotalAmount'].quantile(0.25)
-    Q3 = data['TotalAmount'].quantile(0.75)
+    Q1, Q3 = compute_quartiles(data['TotalAmount'].dropna().to_numpy())
     IQR = Q3 - Q1
     lower_bound = Q1 - 1.5 * IQR
     upper_bound = Q3 + 1.5 * IQR
     
-    outliers = data[(data['TotalAmount'] < lower_bound) | (data['TotalAmount'] > upper_bound)]
-    num_outliers = outliers.shape[0]
+    # between() is False for missing amounts, so exclude them from the outlier count
+    within_bounds = data['TotalAmount'].between(lower_bound, upper_bound)
+    num_outliers = int((~within_bounds & data['TotalAmount'].notna()).sum())
     print(f"\n=== Number of Outliers Detected in TotalAmount: {num_outliers} ===")
     
     # Visualize outliers
     fig, ax = plt.subplots(figsize=(10,6))
-    sns.boxplot(x=data['TotalAmount'], ax=ax)
+    sns.boxplot(x=data['TotalAmount'].to_numpy(), ax=ax)
     plt.title('Boxplot of TotalAmount')
-    plt.tight_layout()
     plt.close()  # Close the plot as it's not returned
     print("Outliers boxplot generated.")
     
     # Cap outliers
-    data['TotalAmount'] = np.where(data['TotalAmount'] > upper_bound, upper_bound, data['TotalAmount'])
-    data['TotalAmount'] = np.where(data['TotalAmount'] < lower_bound, lower_bound, data['TotalAmount'])
+    data['TotalAmount'] = data['TotalAmount'].clip(lower=lower_bound, upper=upper_bound)
     
     return data, num_outliers
 
-def feature_engineering(data):
+@njit(parallel=True, cache=True)
+def compute_profit_loss(is_sell, total_amount, quantity, price_per_share, out):
     """
-    Perform feature engineering by creating new columns.
+    Fill 'out' with the profit/loss of each transaction in one fused parallel pass (0 for non-Sell rows).
+    
+    Parameters:
+        is_sell (np.ndarray): Boolean mask of Sell transactions.
+        total_amount (np.ndarray): Total amount per transaction.
+        quantity (np.ndarray): Number of shares per transaction.
+        price_per_share (np.ndarray): Price per share per transaction.
+        out (np.ndarray): Output array of the same length.
+    """
+    for i in prange(total_amount.size):
+        out[i] = total_amount[i] - quantity[i] * price_per_share[i] if is_sell[i] else 0.0
+
+def add_features(data):
+    """
+    Add the derived IsSell, ProfitLoss, Year, MonthNum and Month columns.
     
     Parameters:
         data (pd.DataFrame): The dataset.
@@ -150,17 +245,43 @@ def feature_engineering(data):
     Returns:
         pd.DataFrame: Dataset with new features.
     """
+    # Flag Sell transactions once by comparing category codes rather than strings
+    transaction_type = data['TransactionType'].astype('category')
+    categories = transaction_type.cat.categories
+    if 'Sell' in categories:
+        is_sell = transaction_type.cat.codes.to_numpy() == categories.get_loc('Sell')
+    else:
+        is_sell = np.zeros(len(data), dtype=bool)
+    data['IsSell'] = is_sell
+    
     # Calculate Profit/Loss for Sell transactions
-    data['ProfitLoss'] = np.where(
-        data['TransactionType'] == 'Sell',
-        data['TotalAmount'] - (data['Quantity'] * data['PricePerShare']),
-        0
+    profit_loss = np.empty(len(data), dtype=np.float64)
+    compute_profit_loss(
+        is_sell,
+        data['TotalAmount'].to_numpy(dtype=np.float64),
+        data['Quantity'].to_numpy(),
+        data['PricePerShare'].to_numpy(dtype=np.float64),
+        profit_loss
     )
+    data['ProfitLoss'] = profit_loss
     
     # Extract Year and Month from Date
     data['Year'] = data['Date'].dt.year
-    data['Month'] = data['Date'].dt.month_name()
+    data['MonthNum'] = data['Date'].dt.month.astype('int8')
+    data['Month'] = pd.Categorical.from_codes(data['MonthNum'] - 1, categories=MONTH_ORDER, ordered=True)
+    return data
+
+def feature_engineering(data):
+    """
+    Perform feature engineering by creating new columns.
     
+    Parameters:
+        data (pd.DataFrame): The dataset.
+        
+    Returns:
+        pd.DataFrame: Dataset with new features.
+    """
+    data = add_features(data)
     print("\nFeature engineering completed.")
     return data
 
@@ -176,129 +297,245 @@ def filter_data(data, years=2):
         pd.DataFrame: Filtered dataset.
     """
     two_years_ago = pd.Timestamp.today() - pd.DateOffset(years=years)
-    filtered = data[data['Date'] >= two_years_ago]
+    if data['Date'].is_monotonic_increasing:
+        # Data sorted by load_data: binary search for the cutoff and slice the tail
+        start = data['Date'].searchsorted(two_years_ago)
+        # Copy only when rows are dropped so callers can add feature columns to the result
+        filtered = data.iloc[start:].copy() if start > 0 else data
+    else:
+        filtered = data[data['Date'] >= two_years_ago].copy()
     print(f"\nFiltered data to include transactions from the last {years} years.")
     return filtered
 
-def generate_portfolio_allocation_chart(data, summary):
+def compute_chart_aggregates(data):
     """
-    Generate a bar chart for portfolio allocation by sector.
+    Compute the grouped totals used by the charts in a single DuckDB scan.
     
     Parameters:
         data (pd.DataFrame): The dataset.
+        
+    Returns:
+        dict: Aggregated DataFrame per grouping column in AGGREGATE_KEYS, each with
+              TotalAmount, AverageAmount, TransactionCount and ProfitLoss (Sell transactions only).
+    """
+    key_list = ', '.join(f'"{key}"' for key in AGGREGATE_KEYS)
+    grouping_sets = ', '.join(f'("{key}")' for key in AGGREGATE_KEYS)
+    query = f"""
+        SELECT {key_list},
+               GROUPING({key_list}) AS grouping_id,
+               SUM(TotalAmount) AS TotalAmount,
+               AVG(TotalAmount) AS AverageAmount,
+               COUNT(TransactionID) AS TransactionCount,
+               SUM(ProfitLoss) FILTER (WHERE IsSell) AS ProfitLoss
+        FROM transactions
+        GROUP BY GROUPING SETS ({grouping_sets})
+    """
+    con = duckdb.connect()
+    try:
+        con.register('transactions', data)
+        result = con.execute(query).df()
+    finally:
+        con.close()
+    
+    # GROUPING() sets one bit per key that is NOT grouped, with the first key as the most significant bit
+    all_keys_mask = (1 << len(AGGREGATE_KEYS)) - 1
+    metrics = ['TotalAmount', 'AverageAmount', 'TransactionCount', 'ProfitLoss']
+    aggregates = {}
+    for position, key in enumerate(AGGREGATE_KEYS):
+        grouping_id = all_keys_mask ^ (1 << (len(AGGREGATE_KEYS) - 1 - position))
+        rows = result.loc[result['grouping_id'] == grouping_id, [key] + metrics]
+        frame = rows.dropna(subset=[key]).sort_values(key)
+        if isinstance(frame[key].dtype, pd.CategoricalDtype):
+            # Plot plain labels so seaborn follows the row order instead of listing every category
+            frame[key] = frame[key].astype(frame[key].cat.categories.dtype)
+        aggregates[key] = frame
+    return aggregates
+
+def compute_chart_aggregates_streaming(filepath, years=2, block_size=STREAMING_BLOCK_SIZE):
+    """
+    Compute the chart aggregates by streaming the CSV in blocks. Peak memory is one block, the running
+    per-group totals and a sorted array of the TransactionIDs seen so far (8 bytes per record), instead
+    of the whole dataset.
+    
+    Records are de-duplicated by TransactionID and filtered to the last 'years' years, but missing values
+    are not imputed and outliers are not capped, since both need statistics over the full dataset.
+    
+    Parameters:
+        filepath (str): Path to the CSV file.
+        years (int): Number of years to look back.
+        block_size (int): Number of bytes read per CSV block.
+        
+    Returns:
+        dict: Aggregated DataFrame per grouping column, in the same layout as compute_chart_aggregates.
+    """
+    two_years_ago = pd.Timestamp.today() - pd.DateOffset(years=years)
+    read_options = pacsv.ReadOptions(block_size=block_size)
+    convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+    reader = pacsv.open_csv(filepath, read_options=read_options, convert_options=convert_options)
+    
+    seen_ids = np.empty(0, dtype=np.int64)
+    totals = {key: None for key in AGGREGATE_KEYS}
+    for batch in reader:
+        batch_data = batch.to_pandas()
+        batch_data = batch_data.drop_duplicates(subset=['TransactionID'], keep='first')
+        # Binary-search the batch IDs in the sorted IDs of earlier batches
+        ids = batch_data['TransactionID'].to_numpy(dtype=np.int64)
+        positions = np.searchsorted(seen_ids, ids)
+        already_seen = np.zeros(ids.size, dtype=bool)
+        in_range = positions < seen_ids.size
+        already_seen[in_range] = seen_ids[positions[in_range]] == ids[in_range]
+        batch_data = batch_data[~already_seen]
+        # Merge the batch's new IDs into the sorted array instead of re-sorting all seen IDs
+        new_ids = np.sort(ids[~already_seen])
+        seen_ids = np.insert(seen_ids, np.searchsorted(seen_ids, new_ids), new_ids)
+        batch_data = batch_data[batch_data['Date'] >= two_years_ago]
+        if batch_data.empty:
+            continue
+        batch_data = add_features(batch_data)
+        sells = batch_data[batch_data['IsSell']]
+        for key in AGGREGATE_KEYS:
+            # The running totals are sorted when merged, so skip per-batch sorting
+            partial = batch_data.groupby(key, observed=True, sort=False).agg(
+                TotalAmount=('TotalAmount', 'sum'),
+                TransactionCount=('TransactionID', 'count')
+            )
+            partial['ProfitLoss'] = sells.groupby(key, observed=True, sort=False)['ProfitLoss'].sum()
+            if totals[key] is None:
+                totals[key] = partial
+            else:
+                # Fold the batch into the running totals; min_count=1 keeps ProfitLoss missing
+                # for groups without any Sell transaction
+                totals[key] = pd.concat([totals[key], partial]).groupby(level=0).sum(min_count=1)
+    
+    aggregates = {}
+    for key in AGGREGATE_KEYS:
+        if totals[key] is None:
+            # No rows in the window: return an empty frame with the same column types as a non-empty result
+            key_dtype = {'Date': 'datetime64[ns]', 'MonthNum': 'int8'}.get(key, 'object')
+            aggregates[key] = pd.DataFrame({
+                key: pd.Series(dtype=key_dtype),
+                'TotalAmount': pd.Series(dtype='float64'),
+                'AverageAmount': pd.Series(dtype='float64'),
+                'TransactionCount': pd.Series(dtype='int64'),
+                'ProfitLoss': pd.Series(dtype='float64')
+            })
+            continue
+        merged = totals[key].sort_index()
+        merged['AverageAmount'] = merged['TotalAmount'] / merged['TransactionCount']
+        merged = merged.rename_axis(key).reset_index()
+        aggregates[key] = merged[[key, 'TotalAmount', 'AverageAmount', 'TransactionCount', 'ProfitLoss']]
+    return aggregates
+
+def generate_portfolio_allocation_chart(aggregates, summary):
+    """
+    Generate a bar chart for portfolio allocation by sector.
+    
+    Parameters:
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    allocation = data.groupby('Sector')['TotalAmount'].sum().reset_index()
+    allocation = aggregates['Sector']
     plt.figure(figsize=(12,8))
-    sns.barplot(data=allocation, x='Sector', y='TotalAmount', palette='Set2')
+    sns.barplot(x=allocation['Sector'].to_numpy(), y=allocation['TotalAmount'].to_numpy(), palette='Set2')
     plt.title('Portfolio Allocation by Sector')
     plt.xlabel('Sector')
     plt.ylabel('Total Investment ($)')
     plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('charts/portfolio_allocation.png')
+    plt.savefig('charts/portfolio_allocation.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Portfolio Allocation by Sector:** The Technology sector constitutes the largest portion of the investment portfolio, followed by Financials and Consumer Discretionary.")
 
-def generate_sector_performance_chart(data, summary):
+def generate_sector_performance_chart(aggregates, summary):
     """
     Generate a bar chart for sector performance.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    performance = data.groupby('Sector')['TotalAmount'].sum().reset_index().sort_values(by='TotalAmount', ascending=False)
+    performance = aggregates['Sector'].sort_values(by='TotalAmount', ascending=False)
     plt.figure(figsize=(12,8))
-    sns.barplot(data=performance, x='Sector', y='TotalAmount', palette='magma')
+    sns.barplot(x=performance['Sector'].to_numpy(), y=performance['TotalAmount'].to_numpy(), palette='magma')
     plt.title('Sector Performance')
     plt.xlabel('Sector')
     plt.ylabel('Total Investment ($)')
     plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('charts/sector_performance.png')
+    plt.savefig('charts/sector_performance.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Sector Performance:** The Technology sector leads in total investments, showcasing strong performance in recent transactions.")
 
-def generate_stock_trend_chart(data, summary):
+def generate_stock_trend_chart(aggregates, summary):
     """
     Generate a line chart for monthly investment trend.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    monthly = data.groupby('Month')['TotalAmount'].sum().reset_index()
-    month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-                   'July', 'August', 'September', 'October', 'November', 'December']
-    monthly['Month'] = pd.Categorical(monthly['Month'], categories=month_order, ordered=True)
-    monthly = monthly.sort_values('Month')
+    # Group on the integer month and only map to month names for the tick labels
+    monthly = aggregates['MonthNum'].set_index('MonthNum')['TotalAmount'].reindex(range(1, 13), fill_value=0)
     
     plt.figure(figsize=(14,8))
-    sns.lineplot(data=monthly, x='Month', y='TotalAmount', marker='o', color='blue')
+    sns.lineplot(x=monthly.index.to_numpy(), y=monthly.to_numpy(), marker='o', color='blue')
     plt.title('Monthly Investment Trend (Last 2 Years)')
     plt.xlabel('Month')
     plt.ylabel('Total Investment ($)')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('charts/stock_trend.png')
+    plt.xticks(range(1, 13), MONTH_ORDER, rotation=45)
+    plt.savefig('charts/stock_trend.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Monthly Investment Trend:** There is a steady increase in total investments over the months, indicating active portfolio growth.")
 
-def generate_risk_analysis_chart(data, summary):
+def generate_risk_analysis_chart(aggregates, summary):
     """
     Generate a pie chart for Buy vs. Sell transactions.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    risk = data.groupby('TransactionType')['TotalAmount'].sum().reset_index()
+    risk = aggregates['TransactionType']
     plt.figure(figsize=(8,8))
     sns.set_palette(['#66b3ff','#ff9999'])
     plt.pie(risk['TotalAmount'], labels=risk['TransactionType'], autopct='%1.1f%%', startangle=140)
     plt.title('Buy vs. Sell Transactions')
-    plt.tight_layout()
-    plt.savefig('charts/risk_analysis.png')
+    plt.savefig('charts/risk_analysis.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Risk Analysis:** The majority of transactions are Buy operations, suggesting a growth-oriented investment strategy.")
 
-def generate_return_analysis_chart(data, summary):
+def generate_return_analysis_chart(aggregates, summary):
     """
     Generate a bar chart for average investment per sector.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    return_avg = data.groupby('Sector')['TotalAmount'].mean().reset_index()
+    return_avg = aggregates['Sector']
     plt.figure(figsize=(12,8))
-    sns.barplot(data=return_avg, x='Sector', y='TotalAmount', palette='viridis')
+    sns.barplot(x=return_avg['Sector'].to_numpy(), y=return_avg['AverageAmount'].to_numpy(), palette='viridis')
     plt.title('Average Investment per Sector')
     plt.xlabel('Sector')
     plt.ylabel('Average Investment ($)')
     plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('charts/return_analysis.png')
+    plt.savefig('charts/return_analysis.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Return Analysis:** On average, the Technology sector attracts higher investments per transaction compared to other sectors.")
 
-def generate_top_investments_chart(data, summary):
+def generate_top_investments_chart(aggregates, summary):
     """
     Generate a bar chart for top 5 investments by total amount.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    top5 = data.groupby('StockSymbol')['TotalAmount'].sum().reset_index().sort_values(by='TotalAmount', ascending=False).head(5)
+    top5 = aggregates['StockSymbol'].sort_values(by='TotalAmount', ascending=False).head(5)
     plt.figure(figsize=(12,8))
-    sns.barplot(data=top5, x='StockSymbol', y='TotalAmount', palette='coolwarm')
+    sns.barplot(x=top5['StockSymbol'].to_numpy(), y=top5['TotalAmount'].to_numpy(), palette='coolwarm')
     plt.title('Top 5 Investments by Total Amount')
     plt.xlabel('Stock Symbol')
     plt.ylabel('Total Investment ($)')
-    plt.tight_layout()
-    plt.savefig('charts/top_investments.png')
+    plt.savefig('charts/top_investments.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Top 5 Investments:** AAPL, GOOGL, AMZN, NVDA, and CRM are the top-performing stocks in the portfolio based on total investment amounts.")
 
@@ -311,12 +548,11 @@ def generate_customer_age_distribution_chart(data, summary):
         summary (list): Executive summary list to append insights.
     """
     plt.figure(figsize=(12,8))
-    sns.histplot(data['CustomerAge'], bins=15, kde=True, color='skyblue')
+    sns.histplot(data['CustomerAge'].to_numpy(), bins=15, kde=True, color='skyblue')
     plt.title('Customer Age Distribution')
     plt.xlabel('Age')
     plt.ylabel('Number of Transactions')
-    plt.tight_layout()
-    plt.savefig('charts/customer_age_distribution.png')
+    plt.savefig('charts/customer_age_distribution.png', **SAVEFIG_OPTIONS)
     plt.close()
 
 def generate_customer_gender_distribution_chart(data, summary):
@@ -328,67 +564,63 @@ def generate_customer_gender_distribution_chart(data, summary):
         summary (list): Executive summary list to append insights.
     """
     plt.figure(figsize=(10,8))
-    sns.countplot(data=data, x='CustomerGender', palette='pastel')
+    sns.countplot(x=data['CustomerGender'].to_numpy(), palette='pastel')
     plt.title('Customer Gender Distribution')
     plt.xlabel('Gender')
     plt.ylabel('Count')
-    plt.tight_layout()
-    plt.savefig('charts/customer_gender_distribution.png')
+    plt.savefig('charts/customer_gender_distribution.png', **SAVEFIG_OPTIONS)
 
-def generate_transaction_volume_chart(data, summary):
+def generate_transaction_volume_chart(aggregates, summary):
     """
     Generate a line chart for transaction volume over time.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    volume = data.groupby('Date')['TransactionID'].count().reset_index()
+    volume = aggregates['Date']
     plt.figure(figsize=(14,8))
-    sns.lineplot(data=volume, x='Date', y='TransactionID', marker='o', color='green')
+    sns.lineplot(x=volume['Date'].to_numpy(), y=volume['TransactionCount'].to_numpy(), marker='o', color='green')
     plt.title('Transaction Volume Over Time')
     plt.xlabel('Date')
     plt.ylabel('Number of Transactions')
-    plt.tight_layout()
-    plt.savefig('charts/transaction_volume.png')
+    plt.savefig('charts/transaction_volume.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Transaction Volume Over Time:** Transaction activity has been consistent with occasional peaks during specific months.")
 
-def generate_profit_loss_analysis_chart(data, summary):
+def generate_profit_loss_analysis_chart(aggregates, summary):
     """
     Generate a bar chart for profit/loss from sell transactions by stock.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    profit_loss = data[data['TransactionType'] == 'Sell'].groupby('StockSymbol')['ProfitLoss'].sum().reset_index()
+    profit_loss = aggregates['StockSymbol'].dropna(subset=['ProfitLoss'])
     plt.figure(figsize=(12,8))
-    sns.barplot(data=profit_loss, x='StockSymbol', y='ProfitLoss', palette='RdBu')
+    sns.barplot(x=profit_loss['StockSymbol'].to_numpy(), y=profit_loss['ProfitLoss'].to_numpy(), palette='RdBu')
     plt.title('Profit/Loss from Sell Transactions by Stock')
     plt.xlabel('Stock Symbol')
     plt.ylabel('Total Profit/Loss ($)')
-    plt.tight_layout()
-    plt.savefig('charts/profit_loss_analysis.png')
+    plt.savefig('charts/profit_loss_analysis.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Profit/Loss Analysis:** Sell transactions have generated profits across various stocks, with significant gains in high-performing sectors.")
 
-def generate_broker_performance_chart(data, summary):
+def generate_broker_performance_chart(aggregates, summary):
     """
     Generate a bar chart for broker performance based on total investment.
     
     Parameters:
-        data (pd.DataFrame): The dataset.
+        aggregates (dict): Precomputed aggregates from compute_chart_aggregates.
         summary (list): Executive summary list to append insights.
     """
-    broker_perf = data.groupby('Broker')['TotalAmount'].sum().reset_index().sort_values(by='TotalAmount', ascending=False)
+    broker_perf = aggregates['Broker'].sort_values(by='TotalAmount', ascending=False)
     plt.figure(figsize=(12,8))
-    sns.barplot(data=broker_perf, x='Broker', y='TotalAmount', palette='Accent')
+    sns.barplot(x=broker_perf['Broker'].to_numpy(), y=broker_perf['TotalAmount'].to_numpy(), palette='Accent')
     plt.title('Broker Performance')
     plt.xlabel('Broker')
     plt.ylabel('Total Investment ($)')
-    plt.tight_layout()
-    plt.savefig('charts/broker_performance.png')
+    plt.savefig('charts/broker_performance.png', **SAVEFIG_OPTIONS)
     plt.close()
     summary.append("• **Broker Performance:** Fidelity and Charles Schwab handle the majority of the investment transactions, indicating their popularity among investors.")
 
@@ -414,34 +646,32 @@ def compile_executive_summary(summary):
     Parameters:
         summary (list): List of executive summary bullet points.
     """
+    chart_files = [
+        'portfolio_allocation.png',
+        'sector_performance.png',
+        'stock_trend.png',
+        'risk_analysis.png',
+        'return_analysis.png',
+        'top_investments.png',
+        'customer_age_distribution.png',
+        'customer_gender_distribution.png',
+        'transaction_volume.png',
+        'profit_loss_analysis.png',
+        'broker_performance.png'
+    ]
+    
+    # Use HTML <img> tags instead of Markdown syntax
+    # chart_template = '<h3>{title}</h3>\n<img alt="{title}" src="../charts/{chart}" width="1000">\n\n'
+    chart_template = '<h3>{title}</h3>\n<img alt="{title}" src="file:///C:/development/repo/finance_data_analytics/charts/{chart}" width="500">\n\n'
+    charts_section = ''.join(
+        chart_template.format(title=chart.split('.')[0].replace('_', ' ').title(), chart=chart)
+        for chart in chart_files
+    )
+    points_section = ''.join(f"{point}\n\n" for point in summary)
+    
+    # Build the whole report and write it in one call
     with open('reports/executive_summary.md', 'w', encoding='utf-8') as f:
-        f.write("# Executive Summary\n\n")
-        for point in summary:
-            f.write(f"{point}\n\n")
-        
-        f.write("\n## Key Charts\n")
-        
-        chart_files = [
-            'portfolio_allocation.png',
-            'sector_performance.png',
-            'stock_trend.png',
-            'risk_analysis.png',
-            'return_analysis.png',
-            'top_investments.png',
-            'customer_age_distribution.png',
-            'customer_gender_distribution.png',
-            'transaction_volume.png',
-            'profit_loss_analysis.png',
-            'broker_performance.png'
-        ]
-        
-        for chart in chart_files:
-            chart_title = chart.split('.')[0].replace('_', ' ').title()
-            # Use HTML <img> tag instead of Markdown syntax
-            f.write(f'<h3>{chart_title}</h3>\n')
-            # f.write(f'<img alt="{chart_title}" src="../charts/{chart}" width="1000">\n\n')
-            f.write(f'<img alt="{chart_title}" src="file:///C:/development/repo/finance_data_analytics/charts/{chart}" width="500">\n\n')
-            
+        f.write("# Executive Summary\n\n" + points_section + "\n## Key Charts\n" + charts_section)
     
     print("\n=== Executive Summary Generated ===")
     print("Executive summary is available in 'reports/executive_summary.md'.")
@@ -466,25 +696,59 @@ def generate_pdf_from_md(md_file_path, pdf_file_path):
     # Generate PDF from HTML
     pdfkit.from_string(html_content, pdf_file_path,configuration=config,options=options)
 
+def render_chart(task):
+    """
+    Render a single chart in a worker process and collect its summary insights.
+    
+    Parameters:
+        task (tuple): The chart function and the data it plots.
+        
+    Returns:
+        list: Summary points appended by the chart function.
+    """
+    chart_function, chart_data = task
+    chart_summary = []
+    chart_function(chart_data, chart_summary)
+    return chart_summary
+
+def render_charts(tasks, summary):
+    """
+    Render charts in a pool of worker processes and append their insights to the summary in task order.
+    
+    Parameters:
+        tasks (list): Tuples of chart function and the data it plots.
+        summary (list): Executive summary list to append insights.
+    """
+    # matplotlib is not fork-safe, so workers are started with 'spawn'
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        for chart_summary in executor.map(render_chart, tasks):
+            summary.extend(chart_summary)
+
 def generate_all_charts(data, summary):
     """
-    Generate all required charts and append insights to the summary.
+    Generate all required charts in parallel and append insights to the summary.
     
     Parameters:
         data (pd.DataFrame): The dataset.
         summary (list): Executive summary list to append insights.
     """
-    generate_portfolio_allocation_chart(data, summary)
-    generate_sector_performance_chart(data, summary)
-    generate_stock_trend_chart(data, summary)
-    generate_risk_analysis_chart(data, summary)
-    generate_return_analysis_chart(data, summary)
-    generate_top_investments_chart(data, summary)
-    generate_customer_age_distribution_chart(data, summary)
-    generate_customer_gender_distribution_chart(data, summary)
-    generate_transaction_volume_chart(data, summary)
-    generate_profit_loss_analysis_chart(data, summary)
-    generate_broker_performance_chart(data, summary)
+    aggregates = compute_chart_aggregates(data)
+    # Workers only receive the small aggregates or the single column a chart plots
+    tasks = [
+        (generate_portfolio_allocation_chart, aggregates),
+        (generate_sector_performance_chart, aggregates),
+        (generate_stock_trend_chart, aggregates),
+        (generate_risk_analysis_chart, aggregates),
+        (generate_return_analysis_chart, aggregates),
+        (generate_top_investments_chart, aggregates),
+        (generate_customer_age_distribution_chart, data[['CustomerAge']]),
+        (generate_customer_gender_distribution_chart, data[['CustomerGender']]),
+        (generate_transaction_volume_chart, aggregates),
+        (generate_profit_loss_analysis_chart, aggregates),
+        (generate_broker_performance_chart, aggregates)
+    ]
+    render_charts(tasks, summary)
     generate_customer_demographics_summary(data, summary)
 
 def main():
@@ -499,8 +763,9 @@ def main():
     data = handle_missing_values(data)
     data, duplicates_removed = remove_duplicates(data)
     data, num_outliers = detect_and_handle_outliers(data)
-    data = feature_engineering(data)
+    # Filter before feature engineering so derived columns are only computed for retained rows
     data = filter_data(data, years=2)
+    data = feature_engineering(data)
     
     executive_summary = []
     generate_all_charts(data, executive_summary)
@@ -509,5 +774,33 @@ def main():
     generate_pdf_from_md('reports/executive_summary.md','reports/executive_summary.pdf')
     print("\nCharts have been saved in the 'charts/' directory.")
 
+def main_streaming():
+    """
+    Memory-bounded alternative to main() that streams the CSV and renders only the aggregate-based charts.
+    """
+    setup_directories()
+    years = 2
+    aggregates = compute_chart_aggregates_streaming('data/financial_data.csv', years=years)
+    if aggregates['TransactionType'].empty:
+        print(f"\nNo transactions found in the last {years} years; no charts were generated.")
+        return
+    
+    chart_functions = [
+        generate_portfolio_allocation_chart,
+        generate_sector_performance_chart,
+        generate_stock_trend_chart,
+        generate_risk_analysis_chart,
+        generate_return_analysis_chart,
+        generate_top_investments_chart,
+        generate_transaction_volume_chart,
+        generate_profit_loss_analysis_chart,
+        generate_broker_performance_chart
+    ]
+    render_charts([(chart_function, aggregates) for chart_function in chart_functions], [])
+    print("\nCharts have been saved in the 'charts/' directory.")
+
 if __name__ == "__main__":
-    main()
+    if '--streaming' in sys.argv[1:]:
+        main_streaming()
+    else:
+        main()
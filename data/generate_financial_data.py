@@ -78,14 +78,14 @@ df = pd.DataFrame(data, columns=[
 ])
 
 # Introduce some missing values
-for _ in range(5):
-    idx = random.randint(0, num_records - 1)
-    col = random.choice(['Broker', 'CustomerGender', 'InvestmentHorizon'])
-    df.at[idx, col] = np.nan
+missing_idx = np.random.randint(0, num_records, 5)
+missing_cols = np.random.choice(['Broker', 'CustomerGender', 'InvestmentHorizon'], 5)
+for col in np.unique(missing_cols):
+    df.loc[missing_idx[missing_cols == col], col] = np.nan
 
 # Introduce some duplicate records
 duplicates = df.sample(5)
-df = df.append(duplicates, ignore_index=True)
+df = pd.concat([df, duplicates], ignore_index=True)
 
 # Save to CSV
 df.to_csv('data/financial_data.csv', index=False)
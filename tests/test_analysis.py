@@ -1,14 +1,20 @@
 # tests/test_analysis.py
 
+import warnings
 import pytest
 import pandas as pd
 import numpy as np
 from analysis import (
+    load_data,
     handle_missing_values,
     remove_duplicates,
     detect_and_handle_outliers,
+    compute_quartiles,
     feature_engineering,
-    filter_data
+    filter_data,
+    compute_chart_aggregates,
+    compute_chart_aggregates_streaming,
+    main_streaming
 )
 
 @pytest.fixture
@@ -34,6 +40,23 @@ def sample_data():
     }
     return pd.DataFrame(data)
 
+def test_load_data(sample_data, tmp_path):
+    """
+    Test the load_data function.
+    """
+    filepath = tmp_path / 'financial_data.csv'
+    sample_data.to_csv(filepath, index=False)
+    loaded_data = load_data(str(filepath))
+    # Check that dates are parsed and numeric columns keep their types
+    assert pd.api.types.is_datetime64_any_dtype(loaded_data['Date']), "Date column was not parsed as datetime."
+    assert pd.api.types.is_integer_dtype(loaded_data['Quantity']), "Quantity column was not loaded as integer."
+    assert pd.api.types.is_float_dtype(loaded_data['TotalAmount']), "TotalAmount column was not loaded as float."
+    assert isinstance(loaded_data['Sector'].dtype, pd.CategoricalDtype), "Sector column was not converted to category."
+    # Check that empty cells are loaded as missing values
+    assert loaded_data['CustomerGender'].isnull().sum() == 2, "Missing values were not preserved on load."
+    # Check that records are sorted by date
+    assert loaded_data['Date'].is_monotonic_increasing, "Data was not sorted by Date."
+
 def test_handle_missing_values(sample_data):
     """
     Test the handle_missing_values function.
@@ -72,6 +95,25 @@ def test_detect_and_handle_outliers(sample_data):
     IQR = Q3 - Q1
     upper_bound = Q3 + 1.5 * IQR
     assert cleaned_data.loc[0, 'TotalAmount'] <= upper_bound, "Outliers were not handled (capped) correctly."
+    # Check that missing amounts are not counted as outliers
+    data_with_missing = sample_data.copy()
+    data_with_missing.loc[1, 'TotalAmount'] = np.nan
+    _, num_outliers_with_missing = detect_and_handle_outliers(data_with_missing)
+    assert num_outliers_with_missing == 0, "Missing TotalAmount values were counted as outliers."
+
+def test_compute_quartiles(sample_data):
+    """
+    Test the compute_quartiles function.
+    """
+    values = sample_data['TotalAmount'].to_numpy()
+    Q1, Q3 = compute_quartiles(values)
+    # Check that the quartiles match pandas' interpolated quantiles
+    expected_Q1, expected_Q3 = sample_data['TotalAmount'].quantile([0.25, 0.75])
+    assert np.isclose(Q1, expected_Q1), "First quartile was not computed correctly."
+    assert np.isclose(Q3, expected_Q3), "Third quartile was not computed correctly."
+    # Check that an empty array yields missing quartiles like pandas
+    empty_Q1, empty_Q3 = compute_quartiles(np.array([], dtype=np.float64))
+    assert np.isnan(empty_Q1) and np.isnan(empty_Q3), "Quartiles of an empty array should be NaN."
 
 def test_feature_engineering(sample_data):
     """
@@ -87,6 +129,11 @@ def test_feature_engineering(sample_data):
     sell_row = engineered_data[engineered_data['TransactionType'] == 'Sell'].iloc[0]
     expected_profit_loss = sell_row['TotalAmount'] - (sell_row['Quantity'] * sell_row['PricePerShare'])
     assert sell_row['ProfitLoss'] == expected_profit_loss, "ProfitLoss was not calculated correctly."
+    # Check that the Sell flag matches the transaction type
+    assert (engineered_data['IsSell'] == (engineered_data['TransactionType'] == 'Sell')).all(), "IsSell flag was not set correctly."
+    # Check that the month number and name agree with the date
+    assert (engineered_data['MonthNum'] == engineered_data['Date'].dt.month).all(), "MonthNum was not extracted correctly."
+    assert (engineered_data['Month'].astype(str) == engineered_data['Date'].dt.month_name()).all(), "Month names do not match the dates."
 
 def test_filter_data(sample_data):
     """
@@ -104,3 +151,91 @@ def test_filter_data(sample_data):
     expected_dates = ['2021-11-15', '2022-03-18', '2023-01-25']
     assert all(filtered['Date'].dt.strftime('%Y-%m-%d').isin(expected_dates)), "Filtered data does not match expected dates."
 
+
+def test_filter_data_sorted(sample_data):
+    """
+    Test the filter_data function on date-sorted data.
+    """
+    sorted_data = sample_data.copy()
+    today = pd.Timestamp.today().normalize()
+    sorted_data['Date'] = [today - pd.DateOffset(years=4), today - pd.DateOffset(years=3), today - pd.DateOffset(years=1),
+                           today - pd.DateOffset(months=6), today - pd.DateOffset(months=1), today - pd.DateOffset(months=1)]
+    filtered = filter_data(sorted_data, years=2)
+    # Only the last four records fall within the last two years
+    assert filtered['TransactionID'].tolist() == [5003, 5004, 5005, 5005], "Sorted data was not filtered correctly."
+
+def test_feature_engineering_after_filter_data(sample_data):
+    """
+    Test that feature_engineering can add columns to the output of filter_data on unsorted data.
+    """
+    unsorted_data = sample_data.copy()
+    today = pd.Timestamp.today().normalize()
+    unsorted_data['Date'] = [today - pd.DateOffset(months=1), today - pd.DateOffset(years=4), today - pd.DateOffset(months=6),
+                             today - pd.DateOffset(years=3), today - pd.DateOffset(years=1), today - pd.DateOffset(months=1)]
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        engineered_data = feature_engineering(filter_data(unsorted_data, years=2))
+    # Check by name since pandas only exposes SettingWithCopyWarning in pandas.errors from 1.5
+    setting_with_copy = [w for w in caught if w.category.__name__ == 'SettingWithCopyWarning']
+    assert not setting_with_copy, "Features were assigned onto a slice of the filtered data."
+    # Only the four records within the last two years remain, with features added
+    assert engineered_data['TransactionID'].tolist() == [5001, 5003, 5005, 5005], "Unsorted data was not filtered correctly."
+    assert 'ProfitLoss' in engineered_data.columns, "'ProfitLoss' column was not created."
+
+def test_compute_chart_aggregates(sample_data):
+    """
+    Test the compute_chart_aggregates function.
+    """
+    data, _ = remove_duplicates(sample_data.copy())
+    data = feature_engineering(data)
+    aggregates = compute_chart_aggregates(data)
+    # Check that sector totals and averages match a pandas groupby
+    expected_totals = data.groupby('Sector')['TotalAmount'].sum()
+    expected_means = data.groupby('Sector')['TotalAmount'].mean()
+    sector = aggregates['Sector'].set_index('Sector')
+    assert np.allclose(sector['TotalAmount'], expected_totals[sector.index]), "Sector totals were not aggregated correctly."
+    assert np.allclose(sector['AverageAmount'], expected_means[sector.index]), "Sector averages were not aggregated correctly."
+    # Check that profit/loss is only reported for stocks with Sell transactions
+    profit_loss = aggregates['StockSymbol'].dropna(subset=['ProfitLoss'])
+    assert profit_loss['StockSymbol'].tolist() == ['JPM'], "ProfitLoss was not restricted to Sell transactions."
+    # Check that transaction counts per date add up to the number of records
+    assert aggregates['Date']['TransactionCount'].sum() == len(data), "Transaction volume counts are incorrect."
+
+def test_compute_chart_aggregates_streaming(sample_data, tmp_path):
+    """
+    Test the compute_chart_aggregates_streaming function.
+    """
+    filepath = tmp_path / 'financial_data.csv'
+    sample_data.to_csv(filepath, index=False)
+    # Use a tiny block size so the file is read in several batches
+    aggregates = compute_chart_aggregates_streaming(str(filepath), years=100, block_size=256)
+    data, _ = remove_duplicates(sample_data.copy())
+    expected = compute_chart_aggregates(feature_engineering(data))
+    for key in ['Sector', 'StockSymbol', 'Broker', 'TransactionType', 'MonthNum', 'Date']:
+        streamed = aggregates[key].set_index(key)
+        in_memory = expected[key].set_index(key)
+        # Check that merged partials match the single-pass aggregates, including the duplicate across batches
+        assert streamed.index.tolist() == in_memory.index.tolist(), f"{key} groups do not match."
+        assert np.allclose(streamed['TotalAmount'], in_memory['TotalAmount']), f"{key} totals do not match."
+        # Compare plain values since DuckDB returns MonthNum keys as a nullable integer dtype
+        assert (streamed['TransactionCount'].to_numpy() == in_memory['TransactionCount'].to_numpy()).all(), f"{key} counts do not match."
+        assert np.allclose(streamed['ProfitLoss'], in_memory['ProfitLoss'], equal_nan=True), f"{key} profit/loss does not match."
+
+def test_compute_chart_aggregates_streaming_empty_window(sample_data, tmp_path, monkeypatch):
+    """
+    Test the streaming path when no transactions fall within the time window.
+    """
+    filepath = tmp_path / 'financial_data.csv'
+    sample_data.to_csv(filepath, index=False)
+    # All sample transactions are older than one year
+    aggregates = compute_chart_aggregates_streaming(str(filepath), years=1)
+    for key, frame in aggregates.items():
+        assert frame.empty, f"{key} aggregates should be empty."
+        assert pd.api.types.is_float_dtype(frame['TotalAmount']), f"{key} totals should be float."
+        assert pd.api.types.is_integer_dtype(frame['TransactionCount']), f"{key} counts should be integer."
+    # Check that the streaming workflow stops before rendering any chart
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    sample_data.to_csv(tmp_path / 'data' / 'financial_data.csv', index=False)
+    main_streaming()
+    assert not any((tmp_path / 'charts').iterdir()), "Charts were generated for an empty time window."